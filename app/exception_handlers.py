@@ -0,0 +1,71 @@
+"""Module defining exception handlers for the FastAPI application."""
+
+import orjson
+from fastapi import Request, Response, status
+
+from config.base import logger
+from toolkit.api.enums import HTTPStatusDoc, Status
+from toolkit.api.exceptions import CustomHTTPException
+
+# Static body of the internal server error response, serialized once.
+INTERNAL_SERVER_ERROR_CONTENT = orjson.dumps(
+    {
+        "error": {
+            "status": Status.ERROR,
+            "message": (
+                "Internal Server Error. An unexpected condition was encountered on "
+                "the server."
+            ),
+            "details": None,
+            "documentation_link": HTTPStatusDoc.STATUS_500,
+        }
+    }
+)
+
+
+async def custom_http_exception_handler(
+    request: Request, exc: CustomHTTPException
+) -> Response:
+    """
+    Handle `CustomHTTPException` and return the API error response.
+
+    The body is serialized straight to bytes with orjson, skipping the
+    `jsonable_encoder` pass a `JSONResponse` would go through.
+    """
+    content = orjson.dumps(
+        {
+            "error": {
+                "status": exc.status,
+                "message": exc.message,
+                "details": exc.details,
+                "documentation_link": exc.documentation_link,
+            }
+        }
+    )
+    return Response(
+        content=content,
+        status_code=exc.status_code,
+        headers=exc.headers,
+        media_type="application/json",
+    )
+
+
+async def internal_exception_handler(request: Request, exc: Exception) -> Response:
+    """
+    Handle unexpected exceptions and return the static 500 error response.
+
+    Starlette re-raises the exception once the response is sent, so the server
+    logs the traceback; only a one-line summary is logged here.
+    """
+    logger.error(
+        "Unhandled %s on %s %s: %s",
+        type(exc).__name__,
+        request.method,
+        request.url.path,
+        exc,
+    )
+    return Response(
+        content=INTERNAL_SERVER_ERROR_CONTENT,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        media_type="application/json",
+    )
@@ -0,0 +1,108 @@
+"""Module defining the database probe behind the health-check endpoint."""
+
+import asyncio
+import time
+from typing import Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+from config.base import db, logger
+from config.settings import settings
+
+# Longest a health check waits, in seconds, on the database probe before reporting
+# the database as unavailable. The probe itself is bounded by the driver's
+# connect, statement and TCP timeouts. A probe still running when this expires is
+# not abandoned: later health checks wait on it again instead of starting another.
+HEALTH_CHECK_TIMEOUT = (
+    settings.database_connect_timeout
+    + settings.database_probe_statement_timeout / 1000
+    + 1.0
+)
+
+# Seconds a database probe result is reused by later health checks.
+HEALTH_CHECK_CACHE_TTL = 1.0
+
+
+class DatabaseHealthCheck:
+    """
+    Probe the database, sharing a recent result between health checks.
+
+    A result younger than the TTL is returned as is. Otherwise a single caller
+    waits on the probe while concurrent callers wait for its result, so a burst of
+    health checks costs at most one probe. A probe that outlives the wait keeps
+    running and is awaited again by the next check instead of a new one being
+    started, so at most one probe thread exists at a time.
+    """
+
+    def __init__(self, probe: Callable[[], bool], timeout: float, ttl: float) -> None:
+        """
+        Initialize the DatabaseHealthCheck.
+
+        Parameters
+        ----------
+        probe : Callable[[], bool]
+            Blocking callable returning whether the database is available.
+        timeout : float
+            Seconds a health check waits on the probe.
+        ttl : float
+            Seconds a probe result is reused by later health checks.
+        """
+        self.probe = probe
+        self.timeout = timeout
+        self.ttl = ttl
+        self._cache: tuple[float, bool] | None = None
+        self._in_flight: asyncio.Task[bool] | None = None
+        self._lock = asyncio.Lock()
+
+    def _get_cached(self) -> bool | None:
+        """Return the cached probe result if it is still fresh, None otherwise."""
+        if self._cache is not None and time.monotonic() - self._cache[0] < self.ttl:
+            return self._cache[1]
+        return None
+
+    async def is_available(self) -> bool:
+        """
+        Check whether the database is available.
+
+        Returns
+        -------
+        bool
+            True if the database answered the probe, False otherwise.
+        """
+        cached = self._get_cached()
+        if cached is not None:
+            return cached
+
+        async with self._lock:
+            cached = self._get_cached()
+            if cached is not None:
+                return cached
+
+            if self._in_flight is None or self._in_flight.done():
+                self._in_flight = asyncio.create_task(run_in_threadpool(self.probe))
+            try:
+                is_available = await asyncio.wait_for(
+                    asyncio.shield(self._in_flight), timeout=self.timeout
+                )
+                if not is_available:
+                    logger.error("Database connection test failed!")
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Database health check timed out after %.1f seconds!",
+                    self.timeout,
+                )
+                is_available = False
+            self._cache = (time.monotonic(), is_available)
+        return is_available
+
+
+database_health_check = DatabaseHealthCheck(
+    probe=db.test_connection,
+    timeout=HEALTH_CHECK_TIMEOUT,
+    ttl=HEALTH_CHECK_CACHE_TTL,
+)
+
+
+def get_database_health_check() -> DatabaseHealthCheck:
+    """Return the database health check used by the health-check endpoint."""
+    return database_health_check
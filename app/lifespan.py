@@ -4,8 +4,11 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 
 from config.base import db, logger
+from config.settings import settings
+from config.settings.enums import Env
 from toolkit.database.orm import Base
 
 
@@ -13,8 +16,12 @@ from toolkit.database.orm import Base
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Set lifespan context manager for FastAPI application."""
     engine = db.get_engine()
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables have been created successfully!")
+    # Outside development, creating the schema on startup is opt-in through
+    # `DATABASE_CREATE_TABLES`; it is skipped when the schema is provisioned
+    # separately.
+    if settings.env == Env.DEVELOPMENT or settings.database_create_tables:
+        await run_in_threadpool(Base.metadata.create_all, bind=engine)
+        logger.info("Database tables have been created successfully!")
     yield
     logger.info("Disposing database engine...")
     engine.dispose()
@@ -5,11 +5,23 @@ It initializes the FastAPI application, configures middleware, setting lifespan
 manager, and defines routes for handling various HTTP requests.
 """
 
-from fastapi import FastAPI
+from typing import Annotated
+
+import orjson
+from fastapi import Depends, FastAPI, Response, status
+from fastapi.responses import ORJSONResponse
 
 from config.settings import settings
 from config.settings.openapi import responses
+from toolkit.api.enums import HTTPStatusDoc, Status
+from toolkit.api.exceptions import CustomHTTPException
+from toolkit.api.middlewares import ConcurrencyLimitMiddleware
 
+from .exception_handlers import (
+    custom_http_exception_handler,
+    internal_exception_handler,
+)
+from .healthcheck import DatabaseHealthCheck, get_database_health_check
 from .lifespan import lifespan
 
 # Setup FastAPI instance
@@ -23,11 +35,38 @@ app = FastAPI(
     responses=responses,
     redoc_url=None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Middlewares
+app.add_middleware(
+    ConcurrencyLimitMiddleware,
+    max_concurrency=settings.max_inflight_requests,
+    exempt_paths=("/health",),
 )
 
+# Exception Handlers
+app.add_exception_handler(
+    CustomHTTPException,
+    custom_http_exception_handler,  # type: ignore[arg-type]
+)
+app.add_exception_handler(Exception, internal_exception_handler)
+
+# Static health-check response body, serialized once instead of per request.
+HEALTH_OK_CONTENT = orjson.dumps({"status": "OK"})
+
 
 # Health-Check Endpoint
-@app.get("/health")
-def get_health() -> dict[str, str]:
+@app.get("/health", response_model=dict[str, str])
+async def get_health(
+    health_check: Annotated[DatabaseHealthCheck, Depends(get_database_health_check)],
+) -> Response:
     """Router for health-check of the application."""
-    return {"status": "OK"}
+    if not await health_check.is_available():
+        raise CustomHTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status=Status.ERROR,
+            message="Database is unavailable.",
+            documentation_link=HTTPStatusDoc.STATUS_503,
+        )
+    return Response(content=HEALTH_OK_CONTENT, media_type="application/json")
@@ -1,6 +1,7 @@
 """Module for defining base database configurations."""
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from config.settings import settings
@@ -12,6 +13,7 @@ class DatabaseConnection:
     def __init__(self) -> None:
         """Initialize DatabaseConnection with the specified configuration path."""
         self._engine: Engine | None = None
+        self._session: scoped_session[Session] | None = None
 
     def get_engine(self) -> Engine:
         """
@@ -23,7 +25,24 @@ class DatabaseConnection:
             The database engine object.
         """
         if not self._engine:
-            self._engine = create_engine(settings.database_url)
+            self._engine = create_engine(
+                settings.database_url,
+                pool_pre_ping=True,
+                pool_size=settings.database_pool_size,
+                max_overflow=settings.database_max_overflow,
+                pool_recycle=settings.database_pool_recycle,
+                connect_args={
+                    "connect_timeout": settings.database_connect_timeout,
+                    # Detect dead peers client-side, so a call blocked on a
+                    # half-open connection fails instead of hanging until the
+                    # kernel's default TCP timeouts expire.
+                    "keepalives": 1,
+                    "keepalives_idle": settings.database_tcp_timeout,
+                    "keepalives_interval": 1,
+                    "keepalives_count": 3,
+                    "tcp_user_timeout": settings.database_tcp_timeout * 1000,
+                },
+            )
         return self._engine
 
     def get_session(self) -> scoped_session[Session]:
@@ -35,6 +54,31 @@ class DatabaseConnection:
         sqlalchemy.orm.scoped_session[Session]
             A scoped session object.
         """
-        engine = self.get_engine()
-        Session = sessionmaker(bind=engine)
-        return scoped_session(Session)
+        if self._session is None:
+            session_factory = sessionmaker(bind=self.get_engine())
+            self._session = scoped_session(session_factory)
+        return self._session
+
+    def test_connection(self) -> bool:
+        """
+        Test the database connection with a lightweight `SELECT 1` query.
+
+        The query runs directly on a pooled connection rather than through an ORM
+        session, inside a transaction whose `statement_timeout` is lowered so the
+        server cancels the probe instead of letting it hang.
+
+        Returns
+        -------
+        bool
+            True if the database answered the query, False otherwise.
+        """
+        try:
+            with self.get_engine().connect() as connection:
+                connection.exec_driver_sql(
+                    "SET LOCAL statement_timeout = "
+                    f"{settings.database_probe_statement_timeout}"
+                )
+                connection.execute(text("SELECT 1"))
+        except SQLAlchemyError:
+            return False
+        return True
@@ -3,8 +3,9 @@
 import logging
 import logging.config
 import logging.handlers
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from toolkit.parsers import TOMLParser
 
@@ -14,6 +15,10 @@ from ..settings import settings
 class LoggingConfig:
     """Class for configuring logging settings based on a specified config file."""
 
+    # The logging configuration is process-wide, so it is applied only once.
+    _is_configured: ClassVar[bool] = False
+    _setup_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, config_path: str = "logging.toml") -> None:
         self._parser = TOMLParser(file_path=config_path)
         self._logger: logging.Logger | None = None
@@ -26,7 +31,17 @@ class LoggingConfig:
         return self._logger
 
     def setup(self) -> None:
-        """Set up the logging configurations."""
+        """Set up the logging configurations, applying them once per process."""
+        with LoggingConfig._setup_lock:
+            if not LoggingConfig._is_configured:
+                self._configure()
+                LoggingConfig._is_configured = True
+
+        # Set the logger object.
+        self._logger = logging.getLogger()
+
+    def _configure(self) -> None:
+        """Read the config file and apply it with `logging.config.dictConfig`."""
         logging_config = self._parser.read()
         # Check or create the dirs of log files specified in the config.
         handlers = logging_config.get("handlers", None)
@@ -43,9 +58,6 @@ class LoggingConfig:
 
         logging.config.dictConfig(logging_config)
 
-        # Set the logger object.
-        self._logger = logging.getLogger()
-
     @staticmethod
     def validate_and_create_dirs(handlers: dict[str, dict[str, Any]]) -> list[Path]:
         """
@@ -56,18 +68,25 @@ class LoggingConfig:
         handlers : dict
             Dictionary containing logging handlers.
 
+        Returns
+        -------
+        list[Path]
+            The unique directories of the handlers' log files.
+
         Notes
         -----
-        The function checks for the existence of directories specified
-        in the 'filename' attribute of each handler in the configuration.
-        If the directories do not exist, they are created.
+        The directories of the 'filename' attribute of each handler in the
+        configuration are created if they do not exist. Handlers sharing a
+        directory result in a single `mkdir` call, and `exist_ok=True` already
+        covers existing directories, so no separate existence check is made.
         """
-        paths = []
-        for handler in handlers.values():
-            handler_path = handler.get("filename", None)
-            if handler_path is not None:
-                path = Path(handler_path)
-                if not path.exists():
-                    path.parent.mkdir(parents=True, exist_ok=True)
-                    paths.append(path)
-        return paths
+        dirs = list(
+            dict.fromkeys(
+                Path(handler["filename"]).parent
+                for handler in handlers.values()
+                if handler.get("filename", None) is not None
+            )
+        )
+        for directory in dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+        return dirs
@@ -1,6 +1,7 @@
 """Module for handling all the settings in the application."""
 
 import os
+from functools import lru_cache
 from typing import Type
 
 from pydantic import Field
@@ -36,7 +37,35 @@ class Settings(BaseSettings):
     # .env Settings
     env: Env
     database_url: str = Field(..., description="Database connection URL.")
+    database_pool_size: int = Field(
+        5, gt=0, description="Number of connections kept open in the database pool."
+    )
+    database_max_overflow: int = Field(
+        10, ge=0, description="Connections allowed beyond the pool size under load."
+    )
+    database_pool_recycle: int = Field(
+        1800, gt=0, description="Seconds after which pooled connections are recycled."
+    )
+    database_connect_timeout: int = Field(
+        2, gt=0, description="Seconds to wait for a new database connection."
+    )
+    database_tcp_timeout: int = Field(
+        10, gt=0, description="Seconds before an unresponsive connection is dropped."
+    )
+    database_probe_statement_timeout: int = Field(
+        500, gt=0, description="Milliseconds the health-check query may run."
+    )
+    database_create_tables: bool = Field(
+        False,
+        description=(
+            "Create missing database tables on startup outside development, where "
+            "they are always created."
+        ),
+    )
     origins: list[str] = Field(..., description="List of allowed API origins.")
+    max_inflight_requests: int = Field(
+        1000, gt=0, description="Maximum number of requests processed concurrently."
+    )
 
     # Settings config
     model_config = SettingsConfigDict(
@@ -66,6 +95,7 @@ class Settings(BaseSettings):
         )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Create a new Settings object."""
+    """Create the Settings object once and return the cached instance."""
     return Settings()  # type: ignore
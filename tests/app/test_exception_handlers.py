@@ -0,0 +1,61 @@
+"""Tests for the exception handlers in app.exception_handlers module."""
+
+import orjson
+import pytest
+from fastapi import Request
+
+from app.exception_handlers import (
+    custom_http_exception_handler,
+    internal_exception_handler,
+)
+from toolkit.api.enums import HTTPStatusDoc, Status
+from toolkit.api.exceptions import CustomHTTPException
+
+
+@pytest.fixture
+def request_() -> Request:
+    """Fixture providing a minimal HTTP request."""
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_custom_http_exception_handler(request_: Request) -> None:
+    """Test that the error body is nested under `error` and headers are sent."""
+    exc = CustomHTTPException(
+        status_code=400,
+        status=Status.ERROR,
+        message="Invalid request.",
+        field="email",
+        reason="Email is already registered.",
+        documentation_link=HTTPStatusDoc.STATUS_400,
+        headers={"X-Error": "invalid"},
+    )
+
+    response = await custom_http_exception_handler(request_, exc)
+
+    assert response.status_code == 400
+    assert response.headers["X-Error"] == "invalid"
+    assert orjson.loads(response.body) == {
+        "error": {
+            "status": Status.ERROR,
+            "message": "Invalid request.",
+            "details": {"field": "email", "reason": "Email is already registered."},
+            "documentation_link": HTTPStatusDoc.STATUS_400,
+        }
+    }
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_internal_exception_handler(request_: Request) -> None:
+    """Test that unexpected exceptions get a 500 with the common error shape."""
+    response = await internal_exception_handler(request_, RuntimeError("boom"))
+
+    assert response.status_code == 500
+    assert orjson.loads(response.body)["error"].keys() == {
+        "status",
+        "message",
+        "details",
+        "documentation_link",
+    }
@@ -0,0 +1,159 @@
+"""Tests for the health-check endpoint in app.main module."""
+
+import threading
+import time
+from typing import Any, AsyncGenerator, Callable, Generator
+from unittest import mock
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.healthcheck import DatabaseHealthCheck, get_database_health_check
+from app.main import app
+from toolkit.api.enums import HTTPStatusDoc, Status
+
+# Run every test on the module's event loop, so they can share the client below.
+pytestmark = pytest.mark.asyncio(scope="module")
+
+
+@pytest.fixture
+def use_health_check() -> Generator[Callable[..., DatabaseHealthCheck], None, None]:
+    """
+    Fixture overriding the health check dependency with a given probe.
+
+    Yields
+    ------
+    Callable[..., DatabaseHealthCheck]
+        A function building a `DatabaseHealthCheck` around a probe, installing it
+        as the dependency override and returning it.
+    """
+
+    def install(
+        probe: Callable[[], bool], timeout: float = 1.0, ttl: float = 1.0
+    ) -> DatabaseHealthCheck:
+        health_check = DatabaseHealthCheck(probe=probe, timeout=timeout, ttl=ttl)
+        app.dependency_overrides[get_database_health_check] = lambda: health_check
+        return health_check
+
+    yield install
+    app.dependency_overrides.pop(get_database_health_check, None)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Fixture providing an HTTP client bound to the FastAPI application.
+
+    The client is created once and shared by all tests of the module; tests swap
+    the health check through dependency overrides, not through the client.
+
+    Yields
+    ------
+    httpx.AsyncClient
+        A client sending requests straight to the ASGI application.
+    """
+    transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize(
+    ["is_db_available", "expected_status", "expected_json"],
+    [
+        (True, 200, {"status": "OK"}),
+        (
+            False,
+            503,
+            {
+                "error": {
+                    "status": Status.ERROR,
+                    "message": "Database is unavailable.",
+                    "details": None,
+                    "documentation_link": HTTPStatusDoc.STATUS_503,
+                }
+            },
+        ),
+    ],
+)
+async def test_health(
+    client: httpx.AsyncClient,
+    use_health_check: Callable[..., DatabaseHealthCheck],
+    is_db_available: bool,
+    expected_status: int,
+    expected_json: dict[str, Any],
+) -> None:
+    """
+    Test the health check response for an available and an unavailable database.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient
+        Client bound to the FastAPI application.
+    use_health_check : Callable[..., DatabaseHealthCheck]
+        Installs a health check around the given probe.
+    is_db_available : bool
+        Result returned by the database probe.
+    expected_status : int
+        Expected HTTP status code.
+    expected_json : dict[str, Any]
+        Expected response body.
+    """
+    use_health_check(mock.Mock(return_value=is_db_available))
+
+    response = await client.get("/health")
+
+    assert response.status_code == expected_status
+    assert response.json() == expected_json
+
+
+@pytest.mark.exception
+async def test_health_database_probe_timeout(
+    client: httpx.AsyncClient,
+    use_health_check: Callable[..., DatabaseHealthCheck],
+) -> None:
+    """Test that the health check returns 503 when the probe exceeds the backstop."""
+
+    def slow_probe() -> bool:
+        time.sleep(0.1)
+        return True
+
+    use_health_check(slow_probe, timeout=0.01)
+
+    response = await client.get("/health")
+
+    assert response.status_code == 503
+
+
+async def test_health_reuses_recent_probe_result(
+    client: httpx.AsyncClient,
+    use_health_check: Callable[..., DatabaseHealthCheck],
+) -> None:
+    """Test that health checks within the cache TTL share a single probe."""
+    probe = mock.Mock(return_value=True)
+    use_health_check(probe)
+
+    responses = [await client.get("/health") for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    probe.assert_called_once()
+
+
+@pytest.mark.exception
+async def test_health_timed_out_probe_is_reused(
+    client: httpx.AsyncClient,
+    use_health_check: Callable[..., DatabaseHealthCheck],
+) -> None:
+    """Test that a probe outliving the backstop is awaited again, not restarted."""
+    release = threading.Event()
+    probe = mock.Mock(side_effect=release.wait)
+    health_check = use_health_check(probe, timeout=0.01, ttl=0)
+
+    responses = [await client.get("/health") for _ in range(3)]
+    release.set()
+    assert health_check._in_flight is not None
+    await health_check._in_flight
+
+    assert [response.status_code for response in responses] == [503, 503, 503]
+    probe.assert_called_once()
@@ -0,0 +1,47 @@
+"""Tests for the CustomHTTPException class in toolkit.api.exceptions module."""
+
+import pytest
+
+from toolkit.api.enums import HTTPStatusDoc, Status
+from toolkit.api.exceptions import CustomHTTPException
+
+
+@pytest.mark.smoke
+@pytest.mark.exception
+def test_headers_are_set_on_exception() -> None:
+    """Test that headers are stored on `.headers` and not used as the detail."""
+    headers = {"WWW-Authenticate": "Bearer"}
+
+    exc = CustomHTTPException(
+        status_code=401,
+        status=Status.ERROR,
+        message="Unauthorized.",
+        documentation_link=HTTPStatusDoc.STATUS_401,
+        headers=headers,
+    )
+
+    assert exc.headers == headers
+    assert exc.detail != headers
+
+
+@pytest.mark.exception
+def test_details_are_built_from_field_and_reason() -> None:
+    """Test that details are populated only when both field and reason are given."""
+    exc = CustomHTTPException(
+        status_code=400,
+        status=Status.ERROR,
+        message="Invalid request.",
+        field="email",
+        reason="Email is already registered.",
+        documentation_link=HTTPStatusDoc.STATUS_400,
+    )
+    exc_without_reason = CustomHTTPException(
+        status_code=400,
+        status=Status.ERROR,
+        message="Invalid request.",
+        field="email",
+        documentation_link=HTTPStatusDoc.STATUS_400,
+    )
+
+    assert exc.details == {"field": "email", "reason": "Email is already registered."}
+    assert exc_without_reason.details is None
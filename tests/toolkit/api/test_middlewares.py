@@ -0,0 +1,97 @@
+"""Tests for the middlewares in toolkit.api.middlewares module."""
+
+import asyncio
+from typing import Any
+
+import orjson
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from toolkit.api.middlewares import ConcurrencyLimitMiddleware
+
+
+class BlockingApp:
+    """ASGI application that blocks until released, then responds with 200."""
+
+    def __init__(self) -> None:
+        """Initialize the BlockingApp."""
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Wait for the release event and send an empty 200 response."""
+        self.started.set()
+        await self.release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+
+def make_scope(path: str = "/items") -> dict[str, Any]:
+    """Build a minimal HTTP scope for the given path."""
+    return {"type": "http", "method": "GET", "path": path, "headers": []}
+
+
+async def call(
+    middleware: ConcurrencyLimitMiddleware, path: str = "/items"
+) -> list[Message]:
+    """Call the middleware with a minimal scope and return the sent messages."""
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(make_scope(path), receive, send)
+    return messages
+
+
+@pytest.fixture
+def blocking_app() -> BlockingApp:
+    """Fixture providing a BlockingApp instance."""
+    return BlockingApp()
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_request_under_limit_is_processed(blocking_app: BlockingApp) -> None:
+    """Test that a request under the concurrency limit reaches the application."""
+    middleware = ConcurrencyLimitMiddleware(blocking_app, max_concurrency=1)
+    blocking_app.release.set()
+
+    messages = await call(middleware)
+
+    assert messages[0]["status"] == 200
+
+
+@pytest.mark.asyncio
+async def test_request_over_limit_is_rejected(blocking_app: BlockingApp) -> None:
+    """Test that a request over the concurrency limit is rejected with 503."""
+    middleware = ConcurrencyLimitMiddleware(blocking_app, max_concurrency=1)
+    in_flight = asyncio.create_task(call(middleware))
+    await blocking_app.started.wait()
+
+    messages = await call(middleware)
+    blocking_app.release.set()
+    await in_flight
+
+    assert messages[0]["status"] == 503
+    assert (b"retry-after", b"1") in messages[0]["headers"]
+    assert orjson.loads(messages[1]["body"])["error"]["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_exempt_path_bypasses_limit(blocking_app: BlockingApp) -> None:
+    """Test that requests to exempt paths are processed even over the limit."""
+    middleware = ConcurrencyLimitMiddleware(
+        blocking_app, max_concurrency=1, exempt_paths=("/health",)
+    )
+    in_flight = asyncio.create_task(call(middleware))
+    await blocking_app.started.wait()
+    blocking_app.release.set()
+
+    messages = await call(middleware, path="/health")
+    await in_flight
+
+    assert messages[0]["status"] == 200
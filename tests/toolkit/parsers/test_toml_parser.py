@@ -7,7 +7,7 @@ import pytest
 from toolkit.parsers import TOMLParser
 from toolkit.parsers.helpers.exceptions import TOMLParseError
 
-SAMPLE_TOML_CONTENT = """
+SAMPLE_TOML_CONTENT = b"""
 [info]
 name = "John"
 age = 30
@@ -35,6 +35,17 @@ def test_read_invalid_syntax_toml_file(
     toml_parser: TOMLParser,
 ) -> None:
     """Test reading an invalid TOML file."""
-    with patch("pathlib.Path.open", mock_open(read_data="invalid syntax")):
+    with patch("pathlib.Path.open", mock_open(read_data=b"invalid syntax")):
         with pytest.raises(TOMLParseError, match="Syntax Error in: `test.toml`!"):
             toml_parser.read()
+
+
+def test_read_invalid_encoding_toml_file(
+    toml_parser: TOMLParser,
+) -> None:
+    """Test reading a TOML file that is not valid UTF-8."""
+    with patch("pathlib.Path.open", mock_open(read_data=b'name = "\xff"')):
+        with pytest.raises(
+            TOMLParseError, match="Invalid UTF-8 encoding in: `test.toml`!"
+        ):
+            toml_parser.read()
@@ -50,4 +50,4 @@ class CustomHTTPException(HTTPException):
                 "field": field,
                 "reason": reason,
             }
-        super().__init__(status_code, headers)
+        super().__init__(status_code=status_code, headers=headers)
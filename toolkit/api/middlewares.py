@@ -0,0 +1,76 @@
+"""Module providing ASGI middlewares for FastAPI applications."""
+
+import asyncio
+from typing import Iterable
+
+import orjson
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from toolkit.api.enums import HTTPStatusDoc, Status
+
+# Static body of the response returned when the server is overloaded.
+_OVERLOADED_CONTENT = orjson.dumps(
+    {
+        "error": {
+            "status": Status.ERROR,
+            "message": "Service Unavailable. The server is overloaded, retry later.",
+            "details": None,
+            "documentation_link": HTTPStatusDoc.STATUS_503,
+        }
+    }
+)
+
+# Seconds clients are asked to wait before retrying an overloaded server.
+_RETRY_AFTER_SECONDS = 1
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    ASGI middleware bounding the number of HTTP requests processed concurrently.
+
+    Requests arriving while the limit is reached are rejected immediately with a
+    503 response carrying a `Retry-After` header instead of queueing on the event
+    loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrency: int,
+        exempt_paths: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize the ConcurrencyLimitMiddleware.
+
+        Parameters
+        ----------
+        app : ASGIApp
+            The ASGI application to wrap.
+        max_concurrency : int
+            The maximum number of requests processed at the same time.
+        exempt_paths : Iterable[str], optional
+            Paths that bypass the limit, e.g. health checks.
+        """
+        self.app = app
+        self.exempt_paths = frozenset(exempt_paths)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process the request, rejecting it if the concurrency limit is reached."""
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self._semaphore.locked():
+            response = Response(
+                content=_OVERLOADED_CONTENT,
+                status_code=503,
+                headers={"Retry-After": str(_RETRY_AFTER_SECONDS)},
+                media_type="application/json",
+            )
+            await response(scope, receive, send)
+            return
+
+        async with self._semaphore:
+            await self.app(scope, receive, send)
@@ -1,10 +1,9 @@
 """Contains the TOMLParser class for parsing TOML files."""
 
 import logging
+import tomllib
 from typing import Any
 
-import tomlkit
-
 from .base import Parser
 from .helpers.exceptions import TOMLParseError
 
@@ -24,10 +23,14 @@ class TOMLParser(Parser):
             The parsed content of the TOML file.
         """
         try:
-            with self.file_path.open(mode="rb") as file:
-                content = tomlkit.load(file)
+            # Slurp the whole file and parse it from memory in a single pass.
+            content = tomllib.loads(self.file_path.read_bytes().decode())
             return content
-        except tomlkit.exceptions.ParseError as err:
+        except UnicodeDecodeError as err:
+            msg = f"Invalid UTF-8 encoding in: `{self.file_path}`!"
+            logger.error(msg, exc_info=True)
+            raise TOMLParseError(msg) from err
+        except tomllib.TOMLDecodeError as err:
             msg = f"Syntax Error in: `{self.file_path}`!"
             logger.error(msg, exc_info=True)
             raise TOMLParseError(msg) from err